@@ -20,6 +20,16 @@ DB_PATH = os.environ.get('SUPER_SCRAPER_DB_PATH', DEFAULT_DB_PATH)
 
 logger = logging.getLogger(__name__)
 
+# Fields stored in their own columns; any other item keys go into the metadata JSON
+MAIN_FIELDS = frozenset({'title', 'price', 'description', 'image_url', 'stock_availability', 'sku'})
+
+INSERT_ITEM_SQL = '''
+    INSERT INTO scraped_items (
+        scrape_job_id, scraper_type, url, title, price, 
+        description, image_url, stock_availability, sku, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 
 def get_db_connection() -> sqlite3.Connection:
     """
@@ -38,6 +48,8 @@ def get_db_connection() -> sqlite3.Connection:
             _thread_local.connection.execute('PRAGMA journal_mode=WAL')
             _thread_local.connection.execute('PRAGMA synchronous=NORMAL')
             _thread_local.connection.execute('PRAGMA cache_size=10000')
+            # Keep temporary sort/GROUP BY structures (e.g. get_recent_jobs) off disk
+            _thread_local.connection.execute('PRAGMA temp_store=MEMORY')
         except sqlite3.Error as e:
             logger.error(f"Failed to connect to database at {DB_PATH}: {e}")
             raise
@@ -95,10 +107,33 @@ def init_db() -> None:
         raise
 
 
+def _item_row(item: Dict[str, Any], scrape_job_id: str, scraper_type: str, url: str) -> tuple:
+    """Build the INSERT parameters for a single item."""
+    # Extract metadata (any extra fields not in main schema)
+    metadata = {k: v for k, v in item.items() if k not in MAIN_FIELDS}
+    
+    return (
+        scrape_job_id,
+        scraper_type,
+        url,
+        item.get('title'),
+        item.get('price'),
+        item.get('description'),
+        item.get('image_url'),
+        1 if item.get('stock_availability') else 0,  # Convert boolean to integer
+        item.get('sku'),
+        json.dumps(metadata) if metadata else None
+    )
+
+
 def save_items(items: List[Dict[str, Any]], scrape_job_id: str, scraper_type: str, url: str) -> int:
     """
     Save a list of scraped items to the database.
     
+    All items are inserted with a single executemany call inside one
+    transaction. If any row is rejected, the batch is retried row by row
+    so the remaining items are still saved.
+    
     Args:
         items: List of item dictionaries containing scraped data
         scrape_job_id: Unique identifier for this scraping run
@@ -120,38 +155,27 @@ def save_items(items: List[Dict[str, Any]], scrape_job_id: str, scraper_type: st
     saved_count = 0
     
     try:
+        rows = [_item_row(item, scrape_job_id, scraper_type, url) for item in items]
+        
         # Begin transaction
         conn.execute('BEGIN TRANSACTION')
         
-        for item in items:
-            try:
-                # Extract metadata (any extra fields not in main schema)
-                main_fields = {'title', 'price', 'description', 'image_url', 'stock_availability', 'sku'}
-                metadata = {k: v for k, v in item.items() if k not in main_fields}
-                
-                cursor.execute('''
-                    INSERT INTO scraped_items (
-                        scrape_job_id, scraper_type, url, title, price, 
-                        description, image_url, stock_availability, sku, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    scrape_job_id,
-                    scraper_type,
-                    url,
-                    item.get('title'),
-                    item.get('price'),
-                    item.get('description'),
-                    item.get('image_url'),
-                    1 if item.get('stock_availability') else 0,  # Convert boolean to integer
-                    item.get('sku'),
-                    json.dumps(metadata) if metadata else None
-                ))
-                saved_count += 1
-                
-            except sqlite3.Error as e:
-                logger.error(f"Failed to save individual item: {e}, item: {item}")
-                # Continue with other items rather than failing entire batch
-                continue
+        try:
+            cursor.executemany(INSERT_ITEM_SQL, rows)
+            saved_count = len(rows)
+        except sqlite3.Error as e:
+            # One bad row aborts executemany; retry individually rather than failing entire batch
+            logger.warning(f"Batch insert failed, retrying items individually: {e}")
+            conn.rollback()
+            conn.execute('BEGIN TRANSACTION')
+            
+            for item, row in zip(items, rows):
+                try:
+                    cursor.execute(INSERT_ITEM_SQL, row)
+                    saved_count += 1
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to save individual item: {e}, item: {item}")
+                    continue
         
         # Commit transaction
         conn.commit()
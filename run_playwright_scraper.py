@@ -23,6 +23,14 @@ from typing import List, Dict, Optional, Any
 from playwright.async_api import async_playwright, Page, Browser
 import pandas as pd
 
+from super_scraper.stock import IN_STOCK_RE, OUT_OF_STOCK_RE
+
+
+# Characters that are not safe in output directory names
+_UNSAFE_DOMAIN_CHARS_RE = re.compile(r'[^a-zA-Z0-9.-]')
+# First number in a price string, e.g. "£1,299.99" -> "1,299.99"
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+
 
 def create_output_directory(url: str) -> str:
     """
@@ -38,13 +46,11 @@ def create_output_directory(url: str) -> str:
     parsed_url = urlparse(url)
     domain = parsed_url.netloc or parsed_url.path
     
-    # Clean the domain name to be filesystem-friendly
-    # Remove www. prefix if present
-    domain = domain.replace('www.', '')
-    # Replace non-alphanumeric characters with underscores
-    domain = re.sub(r'[^a-zA-Z0-9.-]', '_', domain)
-    # Remove trailing dots or underscores
-    domain = domain.strip('._')
+    # Clean the domain name to be filesystem-friendly: drop a leading www.,
+    # replace non-alphanumeric characters with underscores, then trim dots/underscores
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    domain = _UNSAFE_DOMAIN_CHARS_RE.sub('_', domain).strip('._')
     
     # Create timestamp in a short format (YYYYMMDD_HHMMSS)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -70,15 +76,29 @@ def setup_logging(log_file: str, log_level: str) -> logging.Logger:
         Configured logger instance.
     """
     logger = logging.getLogger('playwright_scraper')
-    logger.setLevel(getattr(logging, log_level))
+    level = getattr(logging, log_level)
+    logger.setLevel(level)
+    
+    # Reuse the existing handlers when this logger is already writing to log_file
+    log_path = os.path.abspath(log_file)
+    if any(isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+           for h in logger.handlers):
+        for handler in logger.handlers:
+            handler.setLevel(level)
+        return logger
+    
+    # Remove and close existing handlers to avoid duplication and leaked file descriptors
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
     
     # File handler
     file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(getattr(logging, log_level))
+    file_handler.setLevel(level)
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level))
+    console_handler.setLevel(level)
     
     # Formatter
     formatter = logging.Formatter(
@@ -254,10 +274,10 @@ class PlaywrightScraper:
             
         try:
             # Remove currency symbols and other non-numeric characters
-            price_digits = re.findall(r'[\d,]+\.?\d*', price_text)
-            if price_digits:
+            price_match = _PRICE_RE.search(price_text)
+            if price_match:
                 # Remove commas and convert to float
-                return float(price_digits[0].replace(',', ''))
+                return float(price_match.group().replace(',', ''))
         except (ValueError, IndexError) as e:
             self.logger.debug(f"Could not parse price: {price_text} - {str(e)}")
         
@@ -268,20 +288,10 @@ class PlaywrightScraper:
         if not stock_text:
             return None
             
-        stock_text_lower = stock_text.lower()
-        
-        # Common patterns for in-stock
-        in_stock_patterns = ['in stock', 'available', 'in-stock', 'yes']
-        out_of_stock_patterns = ['out of stock', 'sold out', 'unavailable', 'no']
-        
-        for pattern in in_stock_patterns:
-            if pattern in stock_text_lower:
-                return True
-                
-        for pattern in out_of_stock_patterns:
-            if pattern in stock_text_lower:
-                return False
-                
+        if IN_STOCK_RE.search(stock_text):
+            return True
+        if OUT_OF_STOCK_RE.search(stock_text):
+            return False
         return None
     
     async def extract_item_data(self, page: Page, selector: str) -> List[Dict[str, Any]]:
@@ -703,13 +713,15 @@ async def main():
     # Set up logging
     logger = setup_logging(log_file, args.loglevel)
     
-    print(f"Starting Playwright Scraper...")
-    print(f"Target URL: {args.url}")
-    print(f"Output directory: {output_dir}")
-    print(f"Data will be saved to SQLite database")
-    print(f"Log file: {log_file}")
-    print(f"Log level: {args.loglevel}")
-    print("-" * 50)
+    print("\n".join([
+        f"Starting Playwright Scraper...",
+        f"Target URL: {args.url}",
+        f"Output directory: {output_dir}",
+        f"Data will be saved to SQLite database",
+        f"Log file: {log_file}",
+        f"Log level: {args.loglevel}",
+        "-" * 50,
+    ]))
     
     try:
         # Get validation configuration
@@ -725,10 +737,12 @@ async def main():
         scraper = PlaywrightScraper(args.url, logger)
         saved_count = await scraper.run(validation_config)
         
-        print("-" * 50)
-        print(f"Scraping completed! {saved_count} items saved to SQLite database")
-        print(f"Log file saved to: {log_file}")
-        print(f"Use 'python database.py stats' to view database statistics")
+        print("\n".join([
+            "-" * 50,
+            f"Scraping completed! {saved_count} items saved to SQLite database",
+            f"Log file saved to: {log_file}",
+            f"Use 'python database.py stats' to view database statistics",
+        ]))
         
     except Exception as e:
         print(f"Error occurred: {str(e)}", file=sys.stderr)
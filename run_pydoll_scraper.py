@@ -24,6 +24,8 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 
+from super_scraper.stock import IN_STOCK_RE, OUT_OF_STOCK_RE
+
 try:
     from pydoll.browser import Chrome
 except ImportError:
@@ -31,19 +33,23 @@ except ImportError:
     sys.exit(1)
 
 
+# Characters that are not safe in output directory names
+_UNSAFE_DOMAIN_CHARS_RE = re.compile(r'[^a-zA-Z0-9.-]')
+# First number in a price string, e.g. "£1,299.99" -> "1,299.99"
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+
+
 def create_output_directory(url: str) -> str:
     """Create a directory name based on URL and timestamp."""
     # Parse the URL to get the domain
     parsed_url = urlparse(url)
     domain = parsed_url.netloc or parsed_url.path
     
-    # Clean the domain name to be filesystem-friendly
-    # Remove www. prefix if present
-    domain = domain.replace('www.', '')
-    # Replace non-alphanumeric characters with underscores
-    domain = re.sub(r'[^a-zA-Z0-9.-]', '_', domain)
-    # Remove trailing dots or underscores
-    domain = domain.strip('._')
+    # Clean the domain name to be filesystem-friendly: drop a leading www.,
+    # replace non-alphanumeric characters with underscores, then trim dots/underscores
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    domain = _UNSAFE_DOMAIN_CHARS_RE.sub('_', domain).strip('._')
     
     # Create timestamp in a short format (YYYYMMDD_HHMMSS)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -60,19 +66,29 @@ def create_output_directory(url: str) -> str:
 def setup_logging(log_file: str, log_level: str) -> logging.Logger:
     """Set up logging configuration."""
     logger = logging.getLogger('pydoll_scraper')
-    logger.setLevel(getattr(logging, log_level))
-    
-    # Remove existing handlers to avoid duplication
+    level = getattr(logging, log_level)
+    logger.setLevel(level)
+    
+    # Reuse the existing handlers when this logger is already writing to log_file
+    log_path = os.path.abspath(log_file)
+    if any(isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+           for h in logger.handlers):
+        for handler in logger.handlers:
+            handler.setLevel(level)
+        return logger
+    
+    # Remove and close existing handlers to avoid duplication and leaked file descriptors
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
     
     # File handler
     file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(getattr(logging, log_level))
+    file_handler.setLevel(level)
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level))
+    console_handler.setLevel(level)
     
     # Formatter
     formatter = logging.Formatter(
@@ -139,10 +155,10 @@ class PydollScraper:
             
         try:
             # Remove currency symbols and other non-numeric characters
-            price_digits = re.findall(r'[\d,]+\.?\d*', str(price_text))
-            if price_digits:
+            price_match = _PRICE_RE.search(str(price_text))
+            if price_match:
                 # Remove commas and convert to float
-                return float(price_digits[0].replace(',', ''))
+                return float(price_match.group().replace(',', ''))
         except (ValueError, IndexError) as e:
             self.logger.debug(f"Could not parse price: {price_text} - {str(e)}")
         
@@ -153,20 +169,11 @@ class PydollScraper:
         if not stock_text:
             return None
             
-        stock_text_lower = str(stock_text).lower()
-        
-        # Common patterns for in-stock
-        in_stock_patterns = ['in stock', 'available', 'in-stock', 'yes']
-        out_of_stock_patterns = ['out of stock', 'sold out', 'unavailable', 'no']
-        
-        for pattern in in_stock_patterns:
-            if pattern in stock_text_lower:
-                return True
-                
-        for pattern in out_of_stock_patterns:
-            if pattern in stock_text_lower:
-                return False
-                
+        stock_text = str(stock_text)
+        if IN_STOCK_RE.search(stock_text):
+            return True
+        if OUT_OF_STOCK_RE.search(stock_text):
+            return False
         return None
     
     async def extract_item_data(self, tab, selector: str) -> None:
@@ -544,43 +551,53 @@ class PydollScraper:
         except Exception as e:
             self.logger.error(f"Error scraping page {url}: {str(e)}")
     
+    def _select_field(self, element, selectors: List[str], extract) -> Optional[str]:
+        """Return the first non-empty value for a field, trying selectors in priority order."""
+        for sel in selectors:
+            elem = element.select_one(sel)
+            if elem:
+                value = extract(elem)
+                if value:
+                    return value
+        
+        return None
+    
     def extract_item_from_soup_element(self, element, base_url: str) -> Optional[Dict[str, Any]]:
         """Extract item data from a BeautifulSoup element."""
         try:
             item = {}
             
             # Extract title
-            title_selectors = ['h3 a', 'h2 a', 'a[title]', '.title', '[class*="title"]', 'h4', 'a']
-            for sel in title_selectors:
-                title_elem = element.select_one(sel)
-                if title_elem:
-                    title = title_elem.get('title') or title_elem.get_text(strip=True)
-                    if title:
-                        item['title'] = title
-                        break
-            
-            if not item.get('title'):
+            title = self._select_field(
+                element,
+                ['h3 a', 'h2 a', 'a[title]', '.title', '[class*="title"]', 'h4', 'a'],
+                lambda elem: elem.get('title') or elem.get_text(strip=True)
+            )
+            if not title:
                 return None
+            item['title'] = title
             
             # Extract price
-            price_selectors = ['.price_color', '.price', '[class*="price"]', 'span.price', 'p.price_color']
-            for sel in price_selectors:
-                price_elem = element.select_one(sel)
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    if price_text:
-                        item['price'] = self.parse_price(price_text)
-                        break
-            
-            # Extract description
-            desc_selectors = ['.description', '[class*="description"]', 'p']
-            for sel in desc_selectors:
-                desc_elem = element.select_one(sel)
-                if desc_elem:
-                    desc_text = desc_elem.get_text(strip=True)
-                    if desc_text and len(desc_text) > 10:
-                        item['description'] = desc_text[:200]
-                        break
+            price_text = self._select_field(
+                element,
+                ['.price_color', '.price', '[class*="price"]', 'span.price', 'p.price_color'],
+                lambda elem: elem.get_text(strip=True)
+            )
+            if price_text:
+                item['price'] = self.parse_price(price_text)
+            
+            # Extract description (skip short fragments)
+            def description_text(elem):
+                text = elem.get_text(strip=True)
+                return text if len(text) > 10 else None
+            
+            desc_text = self._select_field(
+                element,
+                ['.description', '[class*="description"]', 'p'],
+                description_text
+            )
+            if desc_text:
+                item['description'] = desc_text[:200]
             
             # Extract image
             img_elem = element.select_one('img')
@@ -594,24 +611,22 @@ class PydollScraper:
                     item['image_url'] = img_src
             
             # Extract stock
-            stock_selectors = ['.availability', '.instock', '[class*="availability"]', '[class*="stock"]']
-            for sel in stock_selectors:
-                stock_elem = element.select_one(sel)
-                if stock_elem:
-                    stock_text = stock_elem.get_text(strip=True)
-                    if stock_text:
-                        item['stock_availability'] = self.parse_stock_availability(stock_text)
-                        break
+            stock_text = self._select_field(
+                element,
+                ['.availability', '.instock', '[class*="availability"]', '[class*="stock"]'],
+                lambda elem: elem.get_text(strip=True)
+            )
+            if stock_text:
+                item['stock_availability'] = self.parse_stock_availability(stock_text)
             
             # Extract SKU
-            sku_selectors = ['[class*="sku"]', '[id*="sku"]', '.product-id']
-            for sel in sku_selectors:
-                sku_elem = element.select_one(sel)
-                if sku_elem:
-                    sku_text = sku_elem.get_text(strip=True)
-                    if sku_text:
-                        item['sku'] = sku_text
-                        break
+            sku_text = self._select_field(
+                element,
+                ['[class*="sku"]', '[id*="sku"]', '.product-id'],
+                lambda elem: elem.get_text(strip=True)
+            )
+            if sku_text:
+                item['sku'] = sku_text
             
             return item
             
@@ -812,14 +827,16 @@ async def main():
     # Set up logging
     logger = setup_logging(log_file, args.loglevel)
     
-    print(f"Starting Pydoll Scraper...")
-    print(f"Target URL: {args.url}")
-    print(f"Output directory: {output_dir}")
-    print(f"Data will be saved to SQLite database")
-    print(f"Log file: {log_file}")
-    print(f"Log level: {args.loglevel}")
-    print(f"Max pages: {args.max_pages}")
-    print("-" * 50)
+    print("\n".join([
+        f"Starting Pydoll Scraper...",
+        f"Target URL: {args.url}",
+        f"Output directory: {output_dir}",
+        f"Data will be saved to SQLite database",
+        f"Log file: {log_file}",
+        f"Log level: {args.loglevel}",
+        f"Max pages: {args.max_pages}",
+        "-" * 50,
+    ]))
     
     try:
         # Get validation configuration
@@ -835,10 +852,12 @@ async def main():
         scraper = PydollScraper(args.url, logger, args.max_pages)
         saved_count = await scraper.run(validation_config)
         
-        print("-" * 50)
-        print(f"Scraping completed! {saved_count or 0} items saved to SQLite database")
-        print(f"Log file saved to: {log_file}")
-        print(f"Use 'python database.py stats' to view database statistics")
+        print("\n".join([
+            "-" * 50,
+            f"Scraping completed! {saved_count or 0} items saved to SQLite database",
+            f"Log file saved to: {log_file}",
+            f"Use 'python database.py stats' to view database statistics",
+        ]))
         
     except Exception as e:
         print(f"Error occurred: {str(e)}", file=sys.stderr)
@@ -16,26 +16,26 @@ import re
 from datetime import datetime
 from urllib.parse import urlparse
 from typing import Optional
-from scrapy.crawler import CrawlerProcess
-from scrapy.utils.project import get_project_settings
 
 # Add the project directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
+# Characters that are not safe in output directory names
+_UNSAFE_DOMAIN_CHARS_RE = re.compile(r'[^a-zA-Z0-9.-]')
+
+
 def create_output_directory(url: str) -> str:
     """Create a directory name based on URL and timestamp."""
     # Parse the URL to get the domain
     parsed_url = urlparse(url)
     domain = parsed_url.netloc or parsed_url.path
     
-    # Clean the domain name to be filesystem-friendly
-    # Remove www. prefix if present
-    domain = domain.replace('www.', '')
-    # Replace non-alphanumeric characters with underscores
-    domain = re.sub(r'[^a-zA-Z0-9.-]', '_', domain)
-    # Remove trailing dots or underscores
-    domain = domain.strip('._')
+    # Clean the domain name to be filesystem-friendly: drop a leading www.,
+    # replace non-alphanumeric characters with underscores, then trim dots/underscores
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    domain = _UNSAFE_DOMAIN_CHARS_RE.sub('_', domain).strip('._')
     
     # Create timestamp in a short format (YYYYMMDD_HHMMSS)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -91,6 +91,10 @@ Examples:
 
 def run_spider(url: str, log_level: str, log_file: Optional[str] = None) -> None:
     """Run the Scrapy spider with the provided configuration."""
+    # Import Scrapy here so --help and argument errors don't pay for loading Twisted
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+    
     # Get project settings
     settings = get_project_settings()
     
@@ -118,20 +122,24 @@ def main() -> None:
     # Create log file path inside the directory
     log_file = os.path.join(output_dir, 'scraper.log')
     
-    print(f"Starting Super Scraper...")
-    print(f"Target URL: {args.url}")
-    print(f"Output directory: {output_dir}")
-    print(f"Data will be saved to SQLite database")
-    print(f"Log file: {log_file}")
-    print(f"Log level: {args.loglevel}")
-    print("-" * 50)
+    print("\n".join([
+        f"Starting Super Scraper...",
+        f"Target URL: {args.url}",
+        f"Output directory: {output_dir}",
+        f"Data will be saved to SQLite database",
+        f"Log file: {log_file}",
+        f"Log level: {args.loglevel}",
+        "-" * 50,
+    ]))
     
     try:
         run_spider(args.url, args.loglevel, log_file)
-        print("-" * 50)
-        print(f"Scraping completed! Results saved to SQLite database")
-        print(f"Log file saved to: {log_file}")
-        print(f"Use 'python database.py stats' to view database statistics")
+        print("\n".join([
+            "-" * 50,
+            f"Scraping completed! Results saved to SQLite database",
+            f"Log file saved to: {log_file}",
+            f"Use 'python database.py stats' to view database statistics",
+        ]))
     except Exception as e:
         print(f"Error occurred: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from urllib.parse import urlparse
 from enum import Enum
 
+_CAPTCHA_RE = re.compile(r'captcha', re.IGNORECASE)
+
 # Mock BeautifulSoup for testing
 class MockSoup:
     def __init__(self, content, parser):
@@ -73,21 +75,25 @@ class SimpleValidator:
             result.is_blocked = True
             result.issues.append("HTTP 403: Access forbidden")
         
-        content = response_data.get('content', '').lower()
-        if 'captcha' in content:
+        content = response_data.get('content', '')
+        if _CAPTCHA_RE.search(content):
             result.is_blocked = True
             result.issues.append("CAPTCHA detected")
         
         # Check bot detection
         headers = response_data.get('headers', {})
-        if any('cf-ray' in k.lower() for k in headers.keys()):
+        header_names = {k.lower() for k in headers}
+        if 'cf-ray' in header_names:
             result.bot_detection_system = BotDetectionSystem.CLOUDFLARE
         
         # Check data quality if not blocked
         if not result.is_blocked and scraped_data:
             total_items = len(scraped_data)
             if total_items > 0:
-                title_count = sum(1 for item in scraped_data if item.get('title'))
+                title_count = 0
+                for item in scraped_data:
+                    if item.get('title'):
+                        title_count += 1
                 if title_count > 0:
                     result.is_successful = True
                     result.confidence_score = title_count / total_items
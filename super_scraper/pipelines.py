@@ -7,8 +7,75 @@
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 from scrapy.exceptions import DropItem
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
 import logging
+import random
 import re
+from collections.abc import Mapping
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+from super_scraper.stock import IN_STOCK_RE, OUT_OF_STOCK_RE
+
+# The shared database module lives at the project root
+try:
+    import database
+except ImportError:
+    database = None
+
+# So do the validators; the legacy ScrapingValidator is the fallback when
+# the enhanced ValidationManager can't be imported
+try:
+    from validation_config import get_validation_config
+    from validation_manager import ValidationManager
+    _VALIDATION_MANAGER_ERROR = None
+except ImportError as e:
+    ValidationManager = None
+    _VALIDATION_MANAGER_ERROR = e
+
+try:
+    from validator import ScrapingValidator
+    _LEGACY_VALIDATOR_ERROR = None
+except ImportError as e:
+    ScrapingValidator = None
+    _LEGACY_VALIDATOR_ERROR = e
+
+
+# Patterns used on every item, compiled once at import time
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+_SKU_RE = re.compile(r'[^\w\-_.]')
+_IMAGE_URL_PREFIXES = ('http://', 'https://', '//')
+# Double quotes cause CSV issues downstream
+_CSV_UNSAFE_TRANS = str.maketrans('"', "'")
+# Query parameters (besides utm_*) that track the visitor rather than identify the page
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga'})
+
+
+def _clean_text(text, limit):
+    """Swap CSV-unsafe quotes, collapse whitespace and newlines, limit length."""
+    if type(text) is not str:
+        text = str(text)
+    # Most scraped text is already clean; isprintable() rejects every
+    # whitespace character except a plain space
+    elif (len(text) <= limit and text.isprintable() and '"' not in text
+            and '  ' not in text and not text.startswith(' ') and not text.endswith(' ')):
+        return text
+    return ' '.join(text.translate(_CSV_UNSAFE_TRANS).split())[:limit]
+
+
+def _normalize_url(url):
+    """Canonicalize a URL: lowercase host, sorted query without tracking parameters, no fragment."""
+    parts = urlsplit(str(url).strip())
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not key.startswith('utm_') and key not in _TRACKING_PARAMS)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', urlencode(query), ''))
+
+
+def _item_to_dict(item):
+    """Shallow-copy an item into a dict; dicts and Scrapy items need no adapter."""
+    if isinstance(item, Mapping):
+        return dict(item)
+    return dict(ItemAdapter(item))
 
 
 class DataValidationPipeline:
@@ -20,8 +87,21 @@ class DataValidationPipeline:
     - Cleaning and normalizing data
     - Dropping invalid items
     - Logging validation issues
+    
+    Spiders that only ever extract some fields can declare them in an
+    ``item_fields`` attribute so the cleaners for the other fields are skipped.
     """
     
+    # Cleaning step for each item field, in the order they run
+    FIELD_CLEANERS = (
+        ('title', 'clean_title'),
+        ('price', 'clean_price'),
+        ('description', 'clean_description'),
+        ('image_url', 'validate_image_url'),
+        ('stock_availability', 'normalize_stock_availability'),
+        ('sku', 'clean_sku'),
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.stats = {
@@ -29,6 +109,38 @@ class DataValidationPipeline:
             'dropped_items': 0,
             'cleaned_items': 0
         }
+        # Cleaning steps bound once, in order, so process_item skips per-item attribute lookups
+        self._cleaners = self._bind_cleaners()
+    
+    def _bind_cleaners(self, fields=None):
+        """
+        Bind the cleaning steps to run for each item.
+        
+        Args:
+            fields: Optional collection of field names to limit cleaning to
+            
+        Returns:
+            tuple: Bound cleaning methods in run order
+        """
+        return tuple(
+            getattr(self, method_name)
+            for field_name, method_name in self.FIELD_CLEANERS
+            if fields is None or field_name in fields
+        )
+    
+    def open_spider(self, spider):
+        """
+        Specialize cleaning for the spider.
+        
+        If the spider declares ``item_fields``, only the cleaners for those
+        fields run.
+        
+        Args:
+            spider: The spider instance
+        """
+        item_fields = getattr(spider, 'item_fields', None)
+        if isinstance(item_fields, (list, tuple, set, frozenset)):
+            self._cleaners = self._bind_cleaners(item_fields)
     
     def process_item(self, item, spider):
         """
@@ -41,23 +153,23 @@ class DataValidationPipeline:
         Returns:
             The processed item or raises DropItem
         """
-        adapter = ItemAdapter(item)
+        # The cleaners only use get() and item assignment, which dicts and
+        # Scrapy items support directly; wrap other item types in an ItemAdapter
+        adapter = item if isinstance(item, Mapping) else ItemAdapter(item)
         
         # Check for required fields
         if not self.validate_required_fields(adapter):
             self.stats['dropped_items'] += 1
-            raise DropItem(f"Missing required fields: {item}")
+            # Scrapy's drop log message already includes the item
+            raise DropItem("Missing required fields: title")
         
         # Clean and normalize data
-        self.clean_title(adapter)
-        self.clean_price(adapter)
-        self.clean_description(adapter)
-        self.validate_image_url(adapter)
-        self.normalize_stock_availability(adapter)
-        self.clean_sku(adapter)
+        for clean in self._cleaners:
+            clean(adapter)
         
         self.stats['valid_items'] += 1
-        self.logger.debug(f"Validated item: {adapter.get('title', 'No title')}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Validated item: %s", adapter.get('title', 'No title'))
         
         return item
     
@@ -73,7 +185,8 @@ class DataValidationPipeline:
         """
         title = adapter.get('title')
         
-        if not title or not str(title).strip():
+        # Selector output is already str; only coerce other types
+        if not title or not (title if type(title) is str else str(title)).strip():
             self.logger.warning("Item dropped: No title found")
             return False
             
@@ -88,13 +201,7 @@ class DataValidationPipeline:
         """
         title = adapter.get('title')
         if title:
-            # Remove extra whitespace and newlines
-            cleaned_title = ' '.join(str(title).split())
-            # Remove special characters that might cause CSV issues
-            cleaned_title = cleaned_title.replace('"', "'").replace('\n', ' ')
-            # Limit length
-            cleaned_title = cleaned_title[:200]
-            adapter['title'] = cleaned_title
+            adapter['title'] = _clean_text(title, 200)
             self.stats['cleaned_items'] += 1
     
     def clean_price(self, adapter):
@@ -108,18 +215,17 @@ class DataValidationPipeline:
         
         if price is not None:
             try:
-                # Ensure price is a float
+                # Ensure price is a float, extracting the numeric value from strings
                 if isinstance(price, str):
-                    # Extract numeric value from string
-                    price_match = re.search(r'[\d,]+\.?\d*', str(price))
-                    if price_match:
-                        price = float(price_match.group().replace(',', ''))
-                    else:
+                    price_match = _PRICE_RE.search(price)
+                    if not price_match:
                         adapter['price'] = None
                         return
+                    price = float(price_match.group().replace(',', ''))
+                else:
+                    price = float(price)
                 
                 # Validate price range
-                price = float(price)
                 if price < 0:
                     self.logger.warning(f"Invalid price (negative): {price}")
                     adapter['price'] = None
@@ -143,13 +249,7 @@ class DataValidationPipeline:
         description = adapter.get('description')
         
         if description:
-            # Remove extra whitespace and newlines
-            cleaned_desc = ' '.join(str(description).split())
-            # Remove special characters that might cause CSV issues
-            cleaned_desc = cleaned_desc.replace('"', "'").replace('\n', ' ')
-            # Limit length
-            cleaned_desc = cleaned_desc[:500]
-            adapter['description'] = cleaned_desc
+            adapter['description'] = _clean_text(description, 500)
     
     def validate_image_url(self, adapter):
         """
@@ -161,15 +261,14 @@ class DataValidationPipeline:
         image_url = adapter.get('image_url')
         
         if image_url:
+            # Clean the URL before checking it so surrounding whitespace doesn't reject it
+            image_url = (image_url if type(image_url) is str else str(image_url)).strip()
             # Basic URL validation
-            if not (str(image_url).startswith('http://') or 
-                    str(image_url).startswith('https://') or 
-                    str(image_url).startswith('//')):
+            if not image_url.startswith(_IMAGE_URL_PREFIXES):
                 self.logger.warning(f"Invalid image URL format: {image_url}")
                 adapter['image_url'] = None
             else:
-                # Clean the URL
-                adapter['image_url'] = str(image_url).strip()
+                adapter['image_url'] = image_url
     
     def normalize_stock_availability(self, adapter):
         """
@@ -183,10 +282,9 @@ class DataValidationPipeline:
         if stock is not None:
             # Convert to boolean if it's not already
             if isinstance(stock, str):
-                stock_lower = stock.lower()
-                if any(word in stock_lower for word in ['yes', 'true', 'in stock', 'available']):
+                if IN_STOCK_RE.search(stock):
                     adapter['stock_availability'] = True
-                elif any(word in stock_lower for word in ['no', 'false', 'out of stock', 'sold out']):
+                elif OUT_OF_STOCK_RE.search(stock):
                     adapter['stock_availability'] = False
                 else:
                     adapter['stock_availability'] = None
@@ -204,9 +302,9 @@ class DataValidationPipeline:
         
         if sku:
             # Remove whitespace and ensure it's a string
-            cleaned_sku = str(sku).strip()
+            cleaned_sku = (sku if type(sku) is str else str(sku)).strip()
             # Remove special characters that might cause issues
-            cleaned_sku = re.sub(r'[^\w\-_.]', '', cleaned_sku)
+            cleaned_sku = _SKU_RE.sub('', cleaned_sku)
             adapter['sku'] = cleaned_sku[:50]  # Limit length
     
     def close_spider(self, spider):
@@ -224,13 +322,37 @@ class DataValidationPipeline:
 
 class DuplicateFilterPipeline:
     """
-    Pipeline to filter out duplicate items based on title and price.
+    Pipeline to filter out duplicate items.
+    
+    Items carrying a ``url`` or ``product_url`` are keyed on the normalized
+    URL, so the same product reached through different links is dropped.
+    Other items are keyed on title and price.
     """
     
-    def __init__(self):
+    def __init__(self, use_bloom_filter=False):
+        # Hashes of the item keys; ints are far smaller than the keyed strings
         self.seen_items = set()
         self.logger = logging.getLogger(__name__)
         self.duplicates_count = 0
+        
+        if use_bloom_filter:
+            # Trade rare false-positive drops for bounded memory on very large crawls
+            try:
+                from pybloom_live import ScalableBloomFilter
+                self.seen_items = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-5)
+                self.logger.info("Duplicate filter using scalable Bloom filter")
+            except ImportError as e:
+                self.logger.warning(f"Bloom filter not available, using exact set: {e}")
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        Create the pipeline from crawler settings.
+        
+        Args:
+            crawler: The Scrapy crawler
+        """
+        return cls(use_bloom_filter=crawler.settings.getbool('DUPLICATE_FILTER_BLOOM', False))
     
     def process_item(self, item, spider):
         """
@@ -243,16 +365,30 @@ class DuplicateFilterPipeline:
         Returns:
             The item if unique, or raises DropItem
         """
-        adapter = ItemAdapter(item)
-        
-        # Create a unique identifier based on title and price
-        title = adapter.get('title', '')
-        price = adapter.get('price', '')
-        item_id = f"{title}:{price}"
+        # Dicts and Scrapy items are mappings, so only wrap other item types
+        # in an ItemAdapter
+        try:
+            get = item.get
+        except AttributeError:
+            get = ItemAdapter(item).get
+        
+        # Create a unique identifier from the product URL, or title and price
+        title = get('title', '')
+        url = get('url') or get('product_url')
+        if url:
+            item_id = hash(_normalize_url(url))
+        else:
+            price = get('price', '')
+            try:
+                item_id = hash((title, price))
+            except TypeError:
+                # Raw list/dict values aren't hashable; key them on their text as before
+                item_id = hash(f"{title}:{price}")
         
         if item_id in self.seen_items:
             self.duplicates_count += 1
-            self.logger.debug(f"Duplicate item dropped: {title}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Duplicate item dropped: %s", title)
             raise DropItem(f"Duplicate item: {title}")
         else:
             self.seen_items.add(item_id)
@@ -276,18 +412,19 @@ class ValidationPipeline:
     
     This pipeline runs after all items are processed and provides comprehensive
     analysis of scraping success, blocking detection, and bot detection.
+    Data quality is scored on a uniform sample of at most ``sample_size``
+    items, so memory stays bounded however large the crawl is.
     """
     
-    def __init__(self):
+    def __init__(self, sample_size=1000):
         self.logger = logging.getLogger(__name__)
         self.items_collected = []
+        self.items_seen = 0
+        self.sample_size = max(1, sample_size)
+        self._random = random.Random()
         self.response_data = None
         
-        # Import validation components
-        try:
-            from validation_config import get_validation_config
-            from validation_manager import ValidationManager
-            
+        if ValidationManager is not None:
             # Get configuration from spider settings or use defaults
             self.config = get_validation_config()
             self.validation_manager = ValidationManager(self.config)
@@ -295,21 +432,30 @@ class ValidationPipeline:
             
             self.logger.info("Enhanced ValidationManager initialized")
             
-        except ImportError as e:
+        else:
             # Fallback to legacy validator
-            self.logger.warning(f"Enhanced validation not available, using legacy: {e}")
-            try:
-                from validator import ScrapingValidator
+            self.logger.warning(f"Enhanced validation not available, using legacy: {_VALIDATION_MANAGER_ERROR}")
+            self.validation_manager = None
+            if ScrapingValidator is not None:
                 self.validator = ScrapingValidator(self.logger)
-                self.validation_manager = None
                 self.validator_available = True
-            except ImportError as e2:
-                self.logger.warning(f"No validation available: {e2}")
+            else:
+                self.logger.warning(f"No validation available: {_LEGACY_VALIDATOR_ERROR}")
                 self.validator_available = False
     
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        Create the pipeline from crawler settings.
+        
+        Args:
+            crawler: The Scrapy crawler
+        """
+        return cls(sample_size=crawler.settings.getint('VALIDATION_SAMPLE_SIZE', 1000))
+    
     def process_item(self, item, spider):
         """
-        Collect items for batch validation.
+        Sample items for batch validation.
         
         Args:
             item: The scraped item
@@ -319,14 +465,24 @@ class ValidationPipeline:
             The unchanged item
         """
         if self.validator_available:
-            adapter = ItemAdapter(item)
-            self.items_collected.append(dict(adapter))
+            self.items_seen += 1
+            if len(self.items_collected) < self.sample_size:
+                self.items_collected.append(_item_to_dict(item))
+            else:
+                # Reservoir sampling (Algorithm R): every item seen so far is
+                # equally likely to be in the sample
+                slot = self._random.randrange(self.items_seen)
+                if slot < self.sample_size:
+                    self.items_collected[slot] = _item_to_dict(item)
         return item
     
-    def close_spider(self, spider):
+    async def close_spider(self, spider):
         """
         Validate collected results when spider finishes.
         
+        Scrapy awaits this coroutine; with the asyncio reactor validation runs
+        on the crawl's own event loop.
+        
         Args:
             spider: The spider instance
         """
@@ -334,15 +490,24 @@ class ValidationPipeline:
             self.logger.info("Skipping validation - No validator available")
             return
         
+        await self._close_spider(spider)
+    
+    async def _close_spider(self, spider):
+        """Run validation and report the results."""
         try:
             if self.validation_manager:
                 # Use enhanced ValidationManager
-                result = self._validate_with_manager(spider)
+                result = await self._validate_with_manager(spider)
             else:
-                # Use legacy validator
-                result = self._validate_with_legacy(spider)
+                # Use legacy validator; it is CPU-bound, so keep it off the reactor thread
+                result = await maybe_deferred_to_future(deferToThread(self._validate_with_legacy, spider))
             
             if result:
+                stats = result.metadata.get('data_stats')
+                if stats and self.items_seen > len(self.items_collected):
+                    # Report the crawl size rather than the sample size
+                    stats['sampled_items'] = stats.get('total_items', len(self.items_collected))
+                    stats['total_items'] = self.items_seen
                 self._log_validation_results(result, spider)
                 self._store_validation_stats(result, spider)
             
@@ -355,17 +520,8 @@ class ValidationPipeline:
                 spider.crawler.stats.set_value('validation_error', str(e))
                 spider.crawler.stats.set_value('validation_successful', False)
     
-    def _validate_with_manager(self, spider):
+    async def _validate_with_manager(self, spider):
         """Validate using the enhanced ValidationManager."""
-        import asyncio
-        
-        # Create or get the event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
         # Get the first response for validation
         first_response = getattr(spider, 'first_response', None)
         if not first_response:
@@ -373,25 +529,13 @@ class ValidationPipeline:
             if hasattr(spider, '_responses') and spider._responses:
                 first_response = spider._responses[0]
         
-        # Create validation task
-        validation_coro = self.validation_manager.validate_scraping_result(
+        return await self.validation_manager.validate_scraping_result(
             scraper_type='scrapy',
             response_source=first_response,
             scraped_data=self.items_collected,
             url=getattr(spider, 'start_urls', [''])[0] if hasattr(spider, 'start_urls') else '',
             task_id=f"scrapy_{spider.name}"
         )
-        
-        # Run validation
-        if loop.is_running():
-            # If loop is already running, create a task
-            task = loop.create_task(validation_coro)
-            # Note: This is a limitation - we can't easily wait for async in sync context
-            # For now, we'll skip async validation in this case
-            self.logger.warning("Async validation skipped - event loop already running")
-            return None
-        else:
-            return loop.run_until_complete(validation_coro)
     
     def _validate_with_legacy(self, spider):
         """Validate using the legacy validator."""
@@ -446,15 +590,18 @@ class ValidationPipeline:
             stats = result.metadata['data_stats']
             self.logger.info(f"📊 DATA STATISTICS:")
             self.logger.info(f"   Total items: {stats.get('total_items', 0)}")
+            if 'sampled_items' in stats:
+                self.logger.info(f"   Quality measured on a sample of: {stats['sampled_items']}")
             self.logger.info(f"   Quality score: {result.confidence_score:.2f}")
             
             field_stats = stats.get('field_completeness', {})
             if field_stats:
-                self.logger.info("   Field completeness:")
-                for field, data in field_stats.items():
-                    completeness = data.get('completeness', 0)
-                    count = data.get('count', 0)
-                    self.logger.info(f"     {field}: {completeness:.1%} ({count} items)")
+                # One record for the whole table rather than one per field
+                lines = [
+                    f"     {field}: {data.get('completeness', 0):.1%} ({data.get('count', 0)} items)"
+                    for field, data in field_stats.items()
+                ]
+                self.logger.info("   Field completeness:\n%s", "\n".join(lines))
         
         # Log issues and warnings
         if result.issues:
@@ -501,19 +648,26 @@ class SQLitePipeline:
     Pipeline to save scraped items to SQLite database.
     
     This pipeline replaces CSV file output with database storage.
-    Items are collected during processing and saved as a batch when the spider closes.
+    Items are collected during processing and saved in batches of
+    ``batch_size``, so memory stays bounded however large the crawl is.
+    Any remainder is saved when the spider closes.
     """
     
-    def __init__(self):
+    def __init__(self, batch_size=1000):
         self.logger = logging.getLogger(__name__)
         self.items_collected = []
+        self.batch_size = max(1, batch_size)
+        self.items_total = 0
+        self.items_saved = 0
+        self.save_error = None
         self.scrape_job_id = None
         self.scraper_type = 'scrapy'
         self.target_url = None
         
         # Initialize database
         try:
-            import database
+            if database is None:
+                raise ImportError("database module not found on the Python path")
             database.init_db()
             self.database_available = True
             self.logger.info("SQLite pipeline initialized - database ready")
@@ -521,6 +675,16 @@ class SQLitePipeline:
             self.logger.error(f"Failed to initialize SQLite pipeline: {e}")
             self.database_available = False
     
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        Create the pipeline from crawler settings.
+        
+        Args:
+            crawler: The Scrapy crawler
+        """
+        return cls(batch_size=crawler.settings.getint('SQLITE_BATCH_SIZE', 1000))
+    
     def open_spider(self, spider):
         """
         Initialize pipeline when spider opens.
@@ -533,9 +697,6 @@ class SQLitePipeline:
         
         try:
             # Generate scrape_job_id using same format as other scrapers
-            from datetime import datetime
-            from urllib.parse import urlparse
-            
             # Get target URL from spider
             if hasattr(spider, 'start_urls') and spider.start_urls:
                 self.target_url = spider.start_urls[0]
@@ -567,18 +728,46 @@ class SQLitePipeline:
         """
         if self.database_available:
             try:
-                adapter = ItemAdapter(item)
-                item_dict = dict(adapter)
+                item_dict = _item_to_dict(item)
                 self.items_collected.append(item_dict)
-                self.logger.debug(f"Collected item for database: {item_dict.get('title', 'No title')}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Collected item for database: %s", item_dict.get('title', 'No title'))
             except Exception as e:
                 self.logger.error(f"Error collecting item for database: {e}")
+            
+            if len(self.items_collected) >= self.batch_size:
+                self._flush()
         
         return item
     
+    def _flush(self):
+        """
+        Save the buffered items to the database and empty the buffer.
+        
+        The buffer is cleared even when the save fails so a broken database
+        cannot make memory grow for the rest of the crawl.
+        """
+        if not self.items_collected:
+            return
+        
+        self.items_total += len(self.items_collected)
+        try:
+            self.items_saved += database.save_items(
+                items=self.items_collected,
+                scrape_job_id=self.scrape_job_id,
+                scraper_type=self.scraper_type,
+                url=self.target_url or "unknown"
+            )
+        except Exception as e:
+            self.save_error = e
+            self.logger.error(f"Failed to save items to database: {e}")
+            self.logger.exception("Full database save error traceback:")
+        finally:
+            self.items_collected.clear()
+    
     def close_spider(self, spider):
         """
-        Save all collected items to database when spider closes.
+        Save any remaining items to database when spider closes.
         
         Args:
             spider: The spider instance
@@ -587,39 +776,26 @@ class SQLitePipeline:
             self.logger.warning("SQLite pipeline unavailable - items not saved to database")
             return
         
-        if not self.items_collected:
+        if not self.items_collected and not self.items_total:
             self.logger.info("No items collected - nothing to save to database")
             return
         
-        try:
-            # Import database module
-            import database
-            
-            # Save items to database
-            saved_count = database.save_items(
-                items=self.items_collected,
-                scrape_job_id=self.scrape_job_id,
-                scraper_type=self.scraper_type,
-                url=self.target_url or "unknown"
-            )
-            
+        self._flush()
+        
+        if self.save_error is None:
             self.logger.info(f"SQLite Pipeline Statistics:")
-            self.logger.info(f"  Items collected: {len(self.items_collected)}")
-            self.logger.info(f"  Items saved to database: {saved_count}")
+            self.logger.info(f"  Items collected: {self.items_total}")
+            self.logger.info(f"  Items saved to database: {self.items_saved}")
             self.logger.info(f"  Scrape job ID: {self.scrape_job_id}")
             self.logger.info(f"  Database location: {database.DB_PATH}")
             
             # Store stats in spider if available
             if hasattr(spider, 'crawler') and spider.crawler:
-                spider.crawler.stats.set_value('database_items_saved', saved_count)
+                spider.crawler.stats.set_value('database_items_saved', self.items_saved)
                 spider.crawler.stats.set_value('database_scrape_job_id', self.scrape_job_id)
                 spider.crawler.stats.set_value('database_location', database.DB_PATH)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save items to database: {e}")
-            self.logger.exception("Full database save error traceback:")
-            
+        else:
             # Store error in stats
             if hasattr(spider, 'crawler') and spider.crawler:
-                spider.crawler.stats.set_value('database_save_error', str(e))
-                spider.crawler.stats.set_value('database_items_saved', 0)
+                spider.crawler.stats.set_value('database_save_error', str(self.save_error))
+                spider.crawler.stats.set_value('database_items_saved', self.items_saved)
@@ -22,9 +22,11 @@ USER_AGENT = "super_scraper (+https://github.com/yourusername/super_scraper)"
 ROBOTSTXT_OBEY = False
 
 # Concurrency and throttling settings
-CONCURRENT_REQUESTS = 8
-CONCURRENT_REQUESTS_PER_DOMAIN = 2
-DOWNLOAD_DELAY = 1
+# These are upper bounds; AutoThrottle (below) paces requests to what the
+# site can take, and DOWNLOAD_DELAY would otherwise be its minimum delay
+CONCURRENT_REQUESTS = 32
+CONCURRENT_REQUESTS_PER_DOMAIN = 8
+DOWNLOAD_DELAY = 0
 
 # Disable cookies (enabled by default)
 COOKIES_ENABLED = False
@@ -65,6 +67,17 @@ ITEM_PIPELINES = {
     "super_scraper.pipelines.SQLitePipeline": 500,  # Save to database last
 }
 
+# Use a scalable Bloom filter instead of an exact set for duplicate filtering.
+# Bounds memory on multi-million item crawls at the cost of rare false drops.
+# Requires the optional pybloom-live package.
+DUPLICATE_FILTER_BLOOM = False
+
+# Number of items the SQLite pipeline buffers before writing them to the database
+SQLITE_BATCH_SIZE = 1000
+
+# Maximum number of items kept in memory for end-of-crawl quality validation
+VALIDATION_SAMPLE_SIZE = 1000
+
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
 AUTOTHROTTLE_ENABLED = True
@@ -74,7 +87,7 @@ AUTOTHROTTLE_START_DELAY = 1
 AUTOTHROTTLE_MAX_DELAY = 10
 # The average number of requests Scrapy should be sending in parallel to
 # each remote server
-AUTOTHROTTLE_TARGET_CONCURRENCY = 2.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
 # Enable showing throttling stats for every response received:
 AUTOTHROTTLE_DEBUG = False
 
@@ -87,6 +100,7 @@ AUTOTHROTTLE_DEBUG = False
 #HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
 
 # Set settings whose default value is deprecated to a future-proof value
+TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
 
 # Logging configuration
@@ -95,7 +109,9 @@ LOG_ENCODING = "utf-8"
 LOG_FILE = "scraper.log"
 LOG_FORMAT = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
 LOG_DATEFORMAT = "%Y-%m-%d %H:%M:%S"
-LOG_STDOUT = True
+# Leave stdout alone: redirecting it into the log sends run_scraper.py's
+# completion banner to the log file instead of the terminal
+LOG_STDOUT = False
 
 # Request retry settings
 RETRY_TIMES = 3
@@ -5,10 +5,139 @@ This spider is designed to be flexible and handle various website structures.
 It uses robust selectors and handles pagination automatically.
 """
 
+import hashlib
+import re
+from collections import OrderedDict
 import scrapy
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 import logging
+from lxml import etree
+from parsel.csstranslator import HTMLTranslator
 from super_scraper.items import SuperScraperItem
+from super_scraper.stock import IN_STOCK_RE, OUT_OF_STOCK_RE
+
+
+_CSS_TRANSLATOR = HTMLTranslator()
+
+# First number in a price string, e.g. '1,299.99' in 'Price: $1,299.99'
+_PRICE_RE = re.compile(r'([0-9][0-9,]*(?:\.[0-9]+)?)')
+
+
+
+def _compile_css(*queries):
+    """
+    Translate CSS queries to XPath and compile them once at import time.
+    
+    ``selector.css(query)`` compiles its XPath again on every call; these
+    fallback chains run for every item on every page.
+    """
+    return tuple(
+        etree.XPath(_CSS_TRANSLATOR.css_to_xpath(query), smart_strings=False)
+        for query in queries
+    )
+
+
+def _first(node, xpaths):
+    """
+    Return the first non-empty match, like chaining ``selector.css(query).get()`` with ``or``.
+    
+    Args:
+        node: lxml element to query, e.g. ``response.selector.root``
+        xpaths: Compiled queries from _compile_css, in priority order
+    """
+    for xpath in xpaths:
+        result = xpath(node)
+        if result and result[0]:
+            return result[0]
+    return None
+
+
+def _absolute_url(base_url, origin, url):
+    """
+    Resolve url against base_url, like urljoin, without re-parsing the base for common cases.
+    
+    Args:
+        base_url: URL of the page the link was found on
+        origin: 'scheme://netloc' of base_url
+        url: Link as it appears in the page
+    """
+    if url.startswith(('http://', 'https://')):
+        return url
+    if url.startswith('/') and not url.startswith('//') and '/.' not in url:
+        return origin + url
+    return urljoin(base_url, url)
+
+
+def _prefer(preferred, options):
+    """Return options with the one that matched on an earlier page moved to the front."""
+    if preferred is None:
+        return options
+    return (preferred,) + tuple(option for option in options if option is not preferred)
+
+
+# Common selectors for product/item containers
+_ITEM_CONTAINERS = (
+    'article.product_pod',  # books.toscrape.com
+    'div.product',
+    'div.item',
+    'article.product',
+    'li.product',
+    'div.product-item',
+    'div.listing-item',
+    'div[class*="product"]',
+    'div[class*="item"]',
+    'article[class*="product"]',
+)
+_ITEM_CONTAINER_XPATHS = dict(zip(_ITEM_CONTAINERS, _compile_css(*_ITEM_CONTAINERS)))
+
+# Field fallbacks for items on listing pages, in priority order
+_ITEM_TITLE = _compile_css(
+    'h3 a::attr(title)', 'h3 a::text', 'h2 a::text', 'a::attr(title)',
+    '.title::text', '[class*="title"]::text', 'h4::text', 'a::text',
+)
+_ITEM_PRICE = _compile_css(
+    '.price_color::text', '.price::text', '[class*="price"]::text',
+    'span.price::text', 'p.price_color::text',
+)
+_ITEM_DESCRIPTION = _compile_css('.description::text', '[class*="description"]::text', 'p::text')
+_ITEM_IMAGE = _compile_css(
+    'img::attr(src)', 'img::attr(data-src)', '.image img::attr(src)',
+    '[class*="image"] img::attr(src)',
+)
+_ITEM_STOCK = _compile_css(
+    '.availability::text', '.instock::text', '[class*="availability"]::text',
+    '[class*="stock"]::text',
+)
+_ITEM_SKU = _compile_css('[class*="sku"]::text', '[id*="sku"]::text', '.product-id::text')
+
+# Field fallbacks for single product pages
+_PAGE_TITLE = _compile_css('h1::text', 'h2.title::text', '[class*="product-title"]::text', 'title::text')
+_PAGE_IMAGE = _compile_css(
+    '[class*="product-image"] img::attr(src)', 'img.main-image::attr(src)',
+    '#product-image img::attr(src)',
+)
+_PAGE_PRICE_TEXT, _PAGE_DESCRIPTION_TEXT = _compile_css(
+    '[class*="price"]::text', '[class*="description"] ::text',
+)
+
+# Common pagination selectors
+_NEXT_PAGE = _compile_css(
+    'li.next a::attr(href)',
+    'a.next::attr(href)',
+    '.pagination .next::attr(href)',
+    'a[rel="next"]::attr(href)',
+    '[class*="pagination"] a[class*="next"]::attr(href)',
+    'a:contains("Next")::attr(href)',
+)
+
+# Common product link selectors
+_PRODUCT_LINKS = _compile_css(
+    'article.product_pod h3 a::attr(href)',
+    '.product a::attr(href)',
+    '.item a::attr(href)',
+    'a.product-link::attr(href)',
+    '[class*="product"] a::attr(href)',
+)
 
 
 class UniversalSpider(scrapy.Spider):
@@ -19,6 +148,8 @@ class UniversalSpider(scrapy.Spider):
     to extract relevant product/item information.
     """
     name = 'universal'
+    # Most recent page digests kept for duplicate detection (~150 B each, so ~15 MB at the cap)
+    seen_pages_limit = 100000
     
     def __init__(self, start_url=None, *args, **kwargs):
         """
@@ -34,8 +165,17 @@ class UniversalSpider(scrapy.Spider):
         
         self.start_urls = [start_url]
         self.allowed_domains = [urlparse(start_url).netloc]
-        self.logger.info(f"Initialized spider for URL: {start_url}")
-        self.logger.info(f"Allowed domain: {self.allowed_domains[0]}")
+        # Digests of page bodies already parsed, to skip duplicates reached via other URLs;
+        # least recently seen first, evicted past seen_pages_limit
+        self.seen_pages = OrderedDict()
+        # Links already followed, so repeats are dropped before a Request is built
+        self.seen_urls = set()
+        # Selectors that matched on earlier pages; pages of one site tend to share a layout
+        self.item_selector = None
+        self.next_page_xpath = None
+        self.product_links_xpath = None
+        self.logger.info("Initialized spider for URL: %s", start_url)
+        self.logger.info("Allowed domain: %s", self.allowed_domains[0])
     
     def parse(self, response):
         """
@@ -44,7 +184,17 @@ class UniversalSpider(scrapy.Spider):
         This method uses multiple strategies to find product/item containers
         and extract relevant information.
         """
-        self.logger.info(f"Parsing page: {response.url}")
+        self.logger.info("Parsing page: %s", response.url)
+        
+        # Skip pages whose content was already parsed under another URL
+        page_digest = hashlib.blake2b(response.body, digest_size=16).digest()
+        if page_digest in self.seen_pages:
+            self.seen_pages.move_to_end(page_digest)
+            self.logger.info("Skipping duplicate page content: %s", response.url)
+            return
+        self.seen_pages[page_digest] = None
+        if len(self.seen_pages) > self.seen_pages_limit:
+            self.seen_pages.popitem(last=False)
         
         # Store response data for validation (limit content to first 10KB for memory efficiency)
         content_sample = response.text[:10000] if len(response.text) > 10000 else response.text
@@ -62,41 +212,31 @@ class UniversalSpider(scrapy.Spider):
             'response_time': response_time
         }
         
-        # Common selectors for product/item containers
-        item_selectors = [
-            'article.product_pod',  # books.toscrape.com
-            'div.product',
-            'div.item',
-            'article.product',
-            'li.product',
-            'div.product-item',
-            'div.listing-item',
-            'div[class*="product"]',
-            'div[class*="item"]',
-            'article[class*="product"]',
-        ]
-        
         items_found = False
+        root = response.selector.root
+        origin = '{0.scheme}://{0.netloc}'.format(urlsplit(response.url))
         
-        # Try each selector until we find items
-        for selector in item_selectors:
-            items = response.css(selector)
+        # Try each selector until we find items, starting with the last one that worked.
+        # Items are bare lxml elements; wrapping each in a parsel Selector buys nothing here.
+        for selector in _prefer(self.item_selector, _ITEM_CONTAINERS):
+            items = _ITEM_CONTAINER_XPATHS[selector](root)
             if items:
-                self.logger.info(f"Found {len(items)} items using selector: {selector}")
+                self.logger.info("Found %d items using selector: %s", len(items), selector)
+                self.item_selector = selector
                 items_found = True
                 
                 for item in items:
                     try:
-                        scraped_item = self.extract_item_data(item, response)
+                        scraped_item = self.extract_item_data(item, response, origin)
                         if scraped_item:
                             yield scraped_item
                     except Exception as e:
-                        self.logger.error(f"Error extracting item: {str(e)}")
+                        self.logger.error("Error extracting item: %s", e)
                         continue
                 break
         
         if not items_found:
-            self.logger.warning(f"No items found on page: {response.url}")
+            self.logger.warning("No items found on page: %s", response.url)
             # Try to extract single item page
             single_item = self.extract_single_item(response)
             if single_item:
@@ -109,30 +249,23 @@ class UniversalSpider(scrapy.Spider):
         if items_found:
             yield from self.follow_product_links(response)
     
-    def extract_item_data(self, selector, response):
+    def extract_item_data(self, selector, response, origin=None):
         """
         Extract data from an item selector.
         
         Args:
-            selector: The selector containing the item
+            selector: The selector (or bare lxml element) containing the item
             response: The response object for URL resolution
+            origin: 'scheme://netloc' of response.url, computed once per page by parse
             
         Returns:
             SuperScraperItem or None
         """
         item = SuperScraperItem()
+        node = getattr(selector, 'root', selector)
         
         # Extract title - try multiple common patterns
-        title = (
-            selector.css('h3 a::attr(title)').get() or
-            selector.css('h3 a::text').get() or
-            selector.css('h2 a::text').get() or
-            selector.css('a::attr(title)').get() or
-            selector.css('.title::text').get() or
-            selector.css('[class*="title"]::text').get() or
-            selector.css('h4::text').get() or
-            selector.css('a::text').get()
-        )
+        title = _first(node, _ITEM_TITLE)
         
         if title:
             item['title'] = title.strip()
@@ -141,55 +274,33 @@ class UniversalSpider(scrapy.Spider):
             return None
         
         # Extract price
-        price_text = (
-            selector.css('.price_color::text').get() or
-            selector.css('.price::text').get() or
-            selector.css('[class*="price"]::text').get() or
-            selector.css('span.price::text').get() or
-            selector.css('p.price_color::text').get()
-        )
+        price_text = _first(node, _ITEM_PRICE)
         
         if price_text:
             item['price'] = self.parse_price(price_text)
         
         # Extract description (often not available in list view)
-        description = (
-            selector.css('.description::text').get() or
-            selector.css('[class*="description"]::text').get() or
-            selector.css('p::text').get()
-        )
+        description = _first(node, _ITEM_DESCRIPTION)
         
         if description:
             item['description'] = description.strip()[:200]  # Limit to 200 chars
         
         # Extract image URL
-        image_url = (
-            selector.css('img::attr(src)').get() or
-            selector.css('img::attr(data-src)').get() or
-            selector.css('.image img::attr(src)').get() or
-            selector.css('[class*="image"] img::attr(src)').get()
-        )
+        image_url = _first(node, _ITEM_IMAGE)
         
         if image_url:
-            item['image_url'] = urljoin(response.url, image_url)
+            if origin is None:
+                origin = '{0.scheme}://{0.netloc}'.format(urlsplit(response.url))
+            item['image_url'] = _absolute_url(response.url, origin, image_url)
         
         # Extract stock availability
-        stock_text = (
-            selector.css('.availability::text').get() or
-            selector.css('.instock::text').get() or
-            selector.css('[class*="availability"]::text').get() or
-            selector.css('[class*="stock"]::text').get()
-        )
+        stock_text = _first(node, _ITEM_STOCK)
         
         if stock_text:
             item['stock_availability'] = self.parse_stock_availability(stock_text)
         
         # Extract SKU (if available)
-        sku = (
-            selector.css('[class*="sku"]::text').get() or
-            selector.css('[id*="sku"]::text').get() or
-            selector.css('.product-id::text').get()
-        )
+        sku = _first(node, _ITEM_SKU)
         
         if sku:
             item['sku'] = sku.strip()
@@ -207,14 +318,10 @@ class UniversalSpider(scrapy.Spider):
             SuperScraperItem or None
         """
         item = SuperScraperItem()
+        root = response.selector.root
         
         # Extract title from various possible locations
-        title = (
-            response.css('h1::text').get() or
-            response.css('h2.title::text').get() or
-            response.css('[class*="product-title"]::text').get() or
-            response.css('title::text').get()
-        )
+        title = _first(root, _PAGE_TITLE)
         
         if not title:
             return None
@@ -222,21 +329,19 @@ class UniversalSpider(scrapy.Spider):
         item['title'] = title.strip()
         
         # Extract other fields using broader selectors
-        price_text = response.css('[class*="price"]::text').re_first(r'[\d,]+\.?\d*')
+        # First price-like number in any price text node, as re_first would return
+        price_matches = (_PRICE_RE.search(text) for text in _PAGE_PRICE_TEXT(root))
+        price_text = next((match.group(1) for match in price_matches if match), None)
         if price_text:
             item['price'] = self.parse_price(price_text)
         
         # Description might be in multiple paragraphs
-        description_parts = response.css('[class*="description"] ::text').getall()
+        description_parts = _PAGE_DESCRIPTION_TEXT(root)
         if description_parts:
             item['description'] = ' '.join(description_parts).strip()[:200]
         
         # Image URL
-        image_url = (
-            response.css('[class*="product-image"] img::attr(src)').get() or
-            response.css('img.main-image::attr(src)').get() or
-            response.css('#product-image img::attr(src)').get()
-        )
+        image_url = _first(root, _PAGE_IMAGE)
         
         if image_url:
             item['image_url'] = urljoin(response.url, image_url)
@@ -250,22 +355,16 @@ class UniversalSpider(scrapy.Spider):
         Args:
             response: The response object
         """
-        # Common pagination selectors
-        next_page_selectors = [
-            'li.next a::attr(href)',
-            'a.next::attr(href)',
-            '.pagination .next::attr(href)',
-            'a[rel="next"]::attr(href)',
-            '[class*="pagination"] a[class*="next"]::attr(href)',
-            'a:contains("Next")::attr(href)',
-        ]
-        
-        for selector in next_page_selectors:
-            next_page = response.css(selector).get()
-            if next_page:
-                next_page_url = urljoin(response.url, next_page)
-                self.logger.info(f"Following pagination to: {next_page_url}")
-                yield response.follow(next_page_url, self.parse)
+        root = response.selector.root
+        for xpath in _prefer(self.next_page_xpath, _NEXT_PAGE):
+            next_page = xpath(root)
+            if next_page and next_page[0]:
+                self.next_page_xpath = xpath
+                next_page_url = urljoin(response.url, next_page[0])
+                if next_page_url not in self.seen_urls:
+                    self.seen_urls.add(next_page_url)
+                    self.logger.info("Following pagination to: %s", next_page_url)
+                    yield response.follow(next_page_url, self.parse)
                 break
     
     def follow_product_links(self, response):
@@ -275,20 +374,17 @@ class UniversalSpider(scrapy.Spider):
         Args:
             response: The response object
         """
-        # Common product link selectors
-        product_link_selectors = [
-            'article.product_pod h3 a::attr(href)',
-            '.product a::attr(href)',
-            '.item a::attr(href)',
-            'a.product-link::attr(href)',
-            '[class*="product"] a::attr(href)',
-        ]
-        
-        for selector in product_link_selectors:
-            links = response.css(selector).getall()
+        root = response.selector.root
+        for xpath in _prefer(self.product_links_xpath, _PRODUCT_LINKS):
+            links = xpath(root)
             if links:
+                self.product_links_xpath = xpath
                 for link in links[:5]:  # Limit to first 5 to avoid too many requests
-                    yield response.follow(link, self.parse_product_detail)
+                    product_url = response.urljoin(link)
+                    if product_url in self.seen_urls:
+                        continue
+                    self.seen_urls.add(product_url)
+                    yield response.follow(product_url, self.parse_product_detail)
                 break
     
     def parse_product_detail(self, response):
@@ -298,7 +394,7 @@ class UniversalSpider(scrapy.Spider):
         Args:
             response: The response object
         """
-        self.logger.info(f"Parsing product detail page: {response.url}")
+        self.logger.info("Parsing product detail page: %s", response.url)
         
         # Try to extract as a single item page
         item = self.extract_single_item(response)
@@ -316,14 +412,13 @@ class UniversalSpider(scrapy.Spider):
             float or None
         """
         try:
-            # Remove currency symbols and other non-numeric characters
-            import re
-            price_digits = re.findall(r'[\d,]+\.?\d*', price_text)
-            if price_digits:
+            # Skip currency symbols and other non-numeric characters
+            match = _PRICE_RE.search(price_text)
+            if match:
                 # Remove commas and convert to float
-                return float(price_digits[0].replace(',', ''))
-        except (ValueError, IndexError) as e:
-            self.logger.debug(f"Could not parse price: {price_text} - {str(e)}")
+                return float(match.group(1).replace(',', ''))
+        except ValueError as e:
+            self.logger.debug("Could not parse price: %s - %s", price_text, e)
         
         return None
     
@@ -339,19 +434,11 @@ class UniversalSpider(scrapy.Spider):
         """
         if not stock_text:
             return None
-            
-        stock_text_lower = stock_text.lower()
         
-        # Common patterns for in-stock
-        in_stock_patterns = ['in stock', 'available', 'in-stock', 'yes']
-        out_of_stock_patterns = ['out of stock', 'sold out', 'no']
+        if IN_STOCK_RE.search(stock_text):
+            return True
+        
+        if OUT_OF_STOCK_RE.search(stock_text):
+            return False
         
-        for pattern in in_stock_patterns:
-            if pattern in stock_text_lower:
-                return True
-                
-        for pattern in out_of_stock_patterns:
-            if pattern in stock_text_lower:
-                return False
-                
         return None
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Stock availability keywords shared by the spider, pipelines and standalone scrapers.
+
+Keywords are matched as whole words so e.g. "unknown" or "now shipping" are
+not read as "no". Check IN_STOCK_RE first: "In stock (no backorders)" is in stock.
+"""
+
+import re
+
+IN_STOCK_RE = re.compile(r'\b(?:yes|true|in[\s-]*stock|available)\b', re.IGNORECASE)
+OUT_OF_STOCK_RE = re.compile(r'\b(?:no|false|out\s*of\s*stock|sold\s*out|unavailable)\b', re.IGNORECASE)
@@ -23,8 +23,8 @@ def test_pydoll_data():
         return False
     
     try:
-        df = pd.read_csv(csv_path)
-        scraped_data = df.to_dict('records')
+        # Don't keep the DataFrame alive alongside the records for the whole test
+        scraped_data = pd.read_csv(csv_path).to_dict('records')
         print(f"📊 Loaded {len(scraped_data)} items from Pydoll CSV")
         print(f"📝 Note: Pydoll fell back to requests mode (no Chrome available)")
     except Exception as e:
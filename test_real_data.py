@@ -24,8 +24,8 @@ def test_with_real_data():
         return False
     
     try:
-        df = pd.read_csv(csv_path)
-        scraped_data = df.to_dict('records')
+        # Don't keep the DataFrame alive alongside the records for the whole test
+        scraped_data = pd.read_csv(csv_path).to_dict('records')
         print(f"📊 Loaded {len(scraped_data)} items from CSV")
     except Exception as e:
         print(f"❌ Error loading CSV: {str(e)}")
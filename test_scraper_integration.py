@@ -8,20 +8,23 @@ This script tests that:
 3. All scrapers can run with validation enabled
 """
 
+import shlex
 import subprocess
 import sys
 import os
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 
-def run_command(command, timeout=60):
-    """Run a command and return the result."""
+def run_command(command, timeout=60, cwd=None):
+    """Run a command (an argv list, no shell) in cwd and return the result."""
     try:
         result = subprocess.run(
             command,
-            shell=True,
+            cwd=cwd,
             capture_output=True,
             text=True,
             timeout=timeout
@@ -29,16 +32,23 @@ def run_command(command, timeout=60):
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
         return -1, "", "Command timed out"
+    except OSError as e:
+        # Without a shell, a missing interpreter raises instead of exiting 127
+        return -1, "", str(e)
 
 
-def test_scraper_help(scraper_name, script_path):
-    """Test that scraper shows help with validation arguments."""
-    print(f"\n📋 Testing {scraper_name} help output...")
+def test_scraper_help(scraper_name, script_path, python_cmd="python", out=print, cwd=None):
+    """
+    Test that scraper shows help with validation arguments.
     
-    returncode, stdout, stderr = run_command(f"python {script_path} --help")
+    Progress goes through ``out`` so concurrent runs can buffer their output.
+    """
+    out(f"\n📋 Testing {scraper_name} help output...")
+    
+    returncode, stdout, stderr = run_command([python_cmd, script_path, "--help"], cwd=cwd)
     
     if returncode != 0:
-        print(f"  ❌ Help command failed: {stderr}")
+        out(f"  ❌ Help command failed: {stderr}")
         return False
     
     # Check for validation arguments
@@ -54,52 +64,53 @@ def test_scraper_help(scraper_name, script_path):
             found_args.append(arg)
     
     if len(found_args) >= 2:  # At least 2 validation args should be present
-        print(f"  ✅ Validation arguments found: {found_args}")
+        out(f"  ✅ Validation arguments found: {found_args}")
         return True
     else:
-        print(f"  ⚠️  Limited validation arguments found: {found_args}")
+        out(f"  ⚠️  Limited validation arguments found: {found_args}")
         return True  # Still pass since validation might not be available
 
 
-def test_scraper_execution(scraper_name, script_path, test_url="https://books.toscrape.com/"):
-    """Test scraper execution with validation."""
-    print(f"\n🚀 Testing {scraper_name} execution with validation...")
+def test_scraper_execution(scraper_name, script_path, test_url="https://books.toscrape.com/",
+                           python_cmd="python", out=print, cwd=None):
+    """Test scraper execution with validation (progress goes through ``out``)."""
+    out(f"\n🚀 Testing {scraper_name} execution with validation...")
     
     # Create a temporary directory for output
     with tempfile.TemporaryDirectory() as temp_dir:
         output_file = os.path.join(temp_dir, 'test_output.csv')
         
         # Build command with validation arguments
-        cmd = (
-            f"python {script_path} "
-            f"--url {test_url} "
-            f"--output test_output.csv "
-            f"--validation-quality-score 0.5 "
-            f"--validation-timeout 30"
-        )
+        cmd = [
+            python_cmd, script_path,
+            "--url", test_url,
+            "--output", "test_output.csv",
+            "--validation-quality-score", "0.5",
+            "--validation-timeout", "30",
+        ]
         
         # Add scraper-specific arguments
         if 'playwright' in script_path or 'pydoll' in script_path:
-            cmd += " --max-pages 1"
+            cmd += ["--max-pages", "1"]
         
-        print(f"  Running: {cmd}")
+        out(f"  Running: {shlex.join(cmd)}")
         
-        returncode, stdout, stderr = run_command(cmd, timeout=120)
+        returncode, stdout, stderr = run_command(cmd, timeout=120, cwd=cwd)
         
         if returncode == 0:
-            print(f"  ✅ {scraper_name} executed successfully")
+            out(f"  ✅ {scraper_name} executed successfully")
             
             # Check if validation output appears in logs
             if "VALIDATION RESULTS" in stdout or "VALIDATION RESULTS" in stderr:
-                print(f"  ✅ Validation system activated")
+                out(f"  ✅ Validation system activated")
             else:
-                print(f"  ⚠️  Validation output not detected (may be in log files)")
+                out(f"  ⚠️  Validation output not detected (may be in log files)")
             
             return True
         else:
-            print(f"  ❌ {scraper_name} execution failed")
-            print(f"  STDOUT: {stdout}")
-            print(f"  STDERR: {stderr}")
+            out(f"  ❌ {scraper_name} execution failed")
+            out(f"  STDOUT: {stdout}")
+            out(f"  STDERR: {stderr}")
             return False
 
 
@@ -112,17 +123,14 @@ def test_validation_arguments():
         import validation_config
         config = validation_config.ValidationConfig()
         
-        # Test environment variable override
-        os.environ['SCRAPER_MIN_DATA_QUALITY_SCORE'] = '0.8'
-        config_with_env = validation_config.ValidationConfig()
+        # Test environment variable override; patch.dict restores os.environ even if this raises
+        with patch.dict(os.environ, {'SCRAPER_MIN_DATA_QUALITY_SCORE': '0.8'}):
+            config_with_env = validation_config.ValidationConfig()
         
         if config_with_env.min_data_quality_score == 0.8:
             print(f"  ✅ Environment variable configuration works")
         else:
             print(f"  ❌ Environment variable configuration failed")
-            
-        # Clean up
-        del os.environ['SCRAPER_MIN_DATA_QUALITY_SCORE']
         
         return True
         
@@ -140,9 +148,8 @@ def main():
     print("🧪 SCRAPER INTEGRATION TESTS WITH VALIDATION")
     print("=" * 60)
     
-    # Change to project directory
-    project_dir = Path(__file__).parent
-    os.chdir(project_dir)
+    # Scrapers run from the project directory; the caller's working directory is left alone
+    project_dir = Path(__file__).resolve().parent
     
     # Activate virtual environment
     venv_python = project_dir / "venv" / "bin" / "python"
@@ -153,17 +160,6 @@ def main():
         python_cmd = "python3"
         print(f"Using system Python: {python_cmd}")
     
-    # Update Python command in subprocess calls
-    global run_command
-    original_run_command = run_command
-    
-    def run_command_with_venv(command, timeout=60):
-        if command.startswith("python "):
-            command = command.replace("python ", f"{python_cmd} ")
-        return original_run_command(command, timeout)
-    
-    run_command = run_command_with_venv
-    
     # Define scrapers to test
     scrapers = [
         ("Scrapy", "run_scraper.py"),
@@ -174,27 +170,47 @@ def main():
     # Test results
     results = {}
     
-    # Test validation configuration
+    # Test validation configuration first: it edits os.environ, which the
+    # scraper subprocesses below would otherwise inherit mid-change
     results['validation_config'] = test_validation_arguments()
     
-    # Test each scraper
+    available = []
     for scraper_name, script_path in scrapers:
-        if not os.path.exists(script_path):
+        if (project_dir / script_path).exists():
+            available.append((scraper_name, script_path))
+        else:
             print(f"\n❌ {script_path} not found, skipping {scraper_name}")
             results[scraper_name] = False
-            continue
-        
-        # Test help output
-        help_result = test_scraper_help(scraper_name, script_path)
+    
+    def run_buffered(test, scraper_name, script_path):
+        lines = []
+        passed_test = test(scraper_name, script_path, python_cmd=python_cmd,
+                           out=lines.append, cwd=project_dir)
+        return passed_test, lines
+    
+    # Each test mostly waits on its subprocess, so run them side by side and
+    # print their buffered output in order once each has finished
+    with ThreadPoolExecutor(max_workers=len(available) + 1) as pool:
+        futures = []
+        for scraper_name, script_path in available:
+            # Test help output
+            futures.append((scraper_name, False, pool.submit(
+                run_buffered, test_scraper_help, scraper_name, script_path)))
+            
+            # Test execution (only for Scrapy to avoid long test times)
+            if scraper_name == "Scrapy":
+                futures.append((scraper_name, True, pool.submit(
+                    run_buffered, test_scraper_execution, scraper_name, script_path)))
         
-        # Test execution (only for Scrapy to avoid long test times)
-        if scraper_name == "Scrapy":
-            exec_result = test_scraper_execution(scraper_name, script_path)
-            results[scraper_name] = help_result and exec_result
-        else:
-            # For Playwright and Pydoll, just test help for now
-            results[scraper_name] = help_result
-            print(f"  ℹ️  Skipping execution test for {scraper_name} (time constraints)")
+        for scraper_name, is_execution, future in futures:
+            passed_test, lines = future.result()
+            for line in lines:
+                print(line)
+            results[scraper_name] = results.get(scraper_name, True) and passed_test
+            
+            if not is_execution and scraper_name != "Scrapy":
+                # For Playwright and Pydoll, just test help for now
+                print(f"  ℹ️  Skipping execution test for {scraper_name} (time constraints)")
     
     # Summary
     print("\n" + "=" * 60)
@@ -177,6 +177,26 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(metadata['rating'], 4.5)
         self.assertEqual(metadata['category'], 'electronics')
     
+    def test_save_items_skips_unbindable_item(self):
+        """Test that one rejected item does not prevent the rest of the batch from saving."""
+        test_items = [
+            {'title': 'Good Product 1', 'price': 10.0},
+            {'title': ['not', 'bindable'], 'price': 20.0},
+            {'title': 'Good Product 2', 'price': 30.0}
+        ]
+        
+        saved_count = database.save_items(
+            items=test_items,
+            scrape_job_id='partial_job',
+            scraper_type='test',
+            url='https://example.com'
+        )
+        
+        self.assertEqual(saved_count, 2)
+        
+        rows = database.get_items_by_job_id('partial_job')
+        self.assertEqual([row['title'] for row in rows], ['Good Product 1', 'Good Product 2'])
+    
     def test_get_items_by_job_id(self):
         """Test retrieving items by job ID."""
         # Save test items
@@ -159,7 +159,7 @@ class TestScraperCommonFunctionality(unittest.TestCase):
             ("Available", True),
             ("Out of Stock", False),
             ("Sold Out", False),
-            ("Unknown", False),  # Implementation returns False for unknown
+            ("Unknown", None),  # "no" only counts as a whole word
         ]
         
         playwright_scraper = PlaywrightScraper("https://example.com", Mock())
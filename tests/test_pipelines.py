@@ -7,9 +7,11 @@ Tests data validation, cleaning, duplicate filtering, and database integration f
 import unittest
 import tempfile
 import os
-from unittest.mock import Mock, MagicMock, patch
+import logging
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from scrapy.exceptions import DropItem
-from super_scraper.pipelines import DataValidationPipeline, DuplicateFilterPipeline, SQLitePipeline
+from twisted.internet import defer
+from super_scraper.pipelines import DataValidationPipeline, DuplicateFilterPipeline, ValidationPipeline, SQLitePipeline
 from super_scraper.items import SuperScraperItem
 
 
@@ -59,6 +61,9 @@ class TestDataValidationPipeline(unittest.TestCase):
             ('Test\nProduct', 'Test Product'),
             ('Test"Product"', "Test'Product'"),
             ('A' * 250, 'A' * 200),  # Length limit
+            ('Test Product', 'Test Product'),  # Already clean
+            ('Test\tProduct', 'Test Product'),
+            ('Test\xa0Product', 'Test Product'),
         ]
         
         for input_title, expected_title in test_cases:
@@ -91,6 +96,7 @@ class TestDataValidationPipeline(unittest.TestCase):
             ('https://example.com/image.jpg', 'https://example.com/image.jpg'),
             ('http://example.com/image.jpg', 'http://example.com/image.jpg'),
             ('//example.com/image.jpg', '//example.com/image.jpg'),
+            ('  https://example.com/image.jpg\n', 'https://example.com/image.jpg'),
             ('invalid-url', None),
             ('/relative/path.jpg', None),
         ]
@@ -113,6 +119,12 @@ class TestDataValidationPipeline(unittest.TestCase):
             ('out of stock', False),
             ('sold out', False),
             ('maybe', None),
+            ('In stock (22 available)', True),
+            ('Instock', True),
+            ('Out of Stock', False),
+            ('unknown', None),
+            ('in-stock', True),
+            ('Unavailable', False),
             (1, True),
             (0, False),
         ]
@@ -161,6 +173,41 @@ class TestDataValidationPipeline(unittest.TestCase):
         
         self.assertEqual(self.pipeline.stats['valid_items'], 3)
         self.assertEqual(self.pipeline.stats['dropped_items'], 1)
+    
+    def test_item_fields_limit_cleaners(self):
+        """Test that a spider's declared item_fields skip cleaners for other fields."""
+        self.spider.item_fields = ('title', 'price')
+        self.pipeline.open_spider(self.spider)
+        try:
+            item = SuperScraperItem({
+                'title': '  Test  Product  ',
+                'price': '$19.99',
+                'sku': '  TEST@123  '
+            })
+            processed = self.pipeline.process_item(item, self.spider)
+        finally:
+            self.pipeline.close_spider(self.spider)
+        
+        self.assertEqual(processed['title'], 'Test Product')
+        self.assertEqual(processed['price'], 19.99)
+        self.assertEqual(processed['sku'], '  TEST@123  ')
+    
+    def test_open_spider_leaves_shared_logger_alone(self):
+        """Test that opening and closing the pipeline doesn't reconfigure the module logger."""
+        root_handler = logging.NullHandler()
+        logging.getLogger().addHandler(root_handler)
+        try:
+            handlers = list(self.pipeline.logger.handlers)
+            
+            self.pipeline.open_spider(self.spider)
+            self.assertTrue(self.pipeline.logger.propagate)
+            self.assertEqual(self.pipeline.logger.handlers, handlers)
+            
+            self.pipeline.close_spider(self.spider)
+            self.assertTrue(self.pipeline.logger.propagate)
+            self.assertEqual(self.pipeline.logger.handlers, handlers)
+        finally:
+            logging.getLogger().removeHandler(root_handler)
 
 
 class TestDuplicateFilterPipeline(unittest.TestCase):
@@ -201,6 +248,17 @@ class TestDuplicateFilterPipeline(unittest.TestCase):
         
         self.assertEqual(self.pipeline.duplicates_count, 1)
     
+    def test_unhashable_price_is_keyed_not_raised(self):
+        """Test that a raw list price (no DataValidationPipeline upstream) is still deduplicated."""
+        item1 = SuperScraperItem({'title': 'Product 1', 'price': ['$10.00', '$12.00']})
+        item2 = SuperScraperItem({'title': 'Product 1', 'price': ['$10.00', '$12.00']})
+        
+        result1 = self.pipeline.process_item(item1, self.spider)
+        self.assertEqual(result1, item1)
+        
+        with self.assertRaises(DropItem):
+            self.pipeline.process_item(item2, self.spider)
+    
     def test_same_title_different_price_not_duplicate(self):
         """Test that items with same title but different price are not duplicates."""
         item1 = SuperScraperItem({'title': 'Product 1', 'price': 10.00})
@@ -224,6 +282,76 @@ class TestDuplicateFilterPipeline(unittest.TestCase):
         
         self.assertEqual(result1, item1)
         self.assertEqual(result2, item2)
+    
+    def test_equivalent_urls_are_duplicates(self):
+        """Test that items are keyed on their normalized URL when present."""
+        item1 = {'title': 'Product 1', 'price': 10.00,
+                 'url': 'https://Shop.example.com/p/1?b=2&a=1&utm_source=mail#reviews'}
+        item2 = {'title': 'Product 1 (sale)', 'price': 8.00,
+                 'url': 'https://shop.example.com/p/1?a=1&b=2&fbclid=abc'}
+        item3 = {'title': 'Product 1', 'price': 10.00,
+                 'url': 'https://shop.example.com/p/2'}
+        
+        self.pipeline.process_item(item1, self.spider)
+        with self.assertRaises(DropItem):
+            self.pipeline.process_item(item2, self.spider)
+        self.assertEqual(self.pipeline.process_item(item3, self.spider), item3)
+    
+    def test_bloom_filter_falls_back_to_set(self):
+        """Test that the exact set is used when pybloom_live is not installed."""
+        with patch.dict('sys.modules', {'pybloom_live': None}):
+            pipeline = DuplicateFilterPipeline(use_bloom_filter=True)
+        
+        self.assertIsInstance(pipeline.seen_items, set)
+        
+        item1 = SuperScraperItem({'title': 'Product 1', 'price': 10.00})
+        item2 = SuperScraperItem({'title': 'Product 1', 'price': 10.00})
+        pipeline.process_item(item1, self.spider)
+        with self.assertRaises(DropItem):
+            pipeline.process_item(item2, self.spider)
+
+
+class TestValidationPipeline(unittest.TestCase):
+    """Test cases for the ValidationPipeline."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pipeline = ValidationPipeline(sample_size=10)
+        self.pipeline.validator_available = True
+        self.spider = Mock()
+    
+    def test_small_crawl_keeps_every_item(self):
+        """Test that crawls smaller than the sample are kept whole."""
+        for i in range(5):
+            self.pipeline.process_item(SuperScraperItem({'title': f'Product {i}'}), self.spider)
+        
+        self.assertEqual(self.pipeline.items_seen, 5)
+        self.assertEqual([item['title'] for item in self.pipeline.items_collected],
+                         [f'Product {i}' for i in range(5)])
+    
+    def test_sample_is_bounded(self):
+        """Test that large crawls only keep sample_size items."""
+        for i in range(100):
+            self.pipeline.process_item(SuperScraperItem({'title': f'Product {i}'}), self.spider)
+        
+        self.assertEqual(self.pipeline.items_seen, 100)
+        self.assertEqual(len(self.pipeline.items_collected), 10)
+        titles = {item['title'] for item in self.pipeline.items_collected}
+        self.assertEqual(len(titles), 10)
+    
+    def test_close_spider_awaits_validation_manager(self):
+        """Test that the ValidationManager coroutine is awaited, not skipped."""
+        self.pipeline.validation_manager = Mock()
+        self.pipeline.validation_manager.validate_scraping_result = AsyncMock(return_value=None)
+        self.spider.start_urls = ['https://example.com']
+        self.pipeline.process_item(SuperScraperItem({'title': 'Product 1'}), self.spider)
+        
+        # No reactor is running under unittest, so drive the coroutine with Twisted directly
+        defer.ensureDeferred(self.pipeline._close_spider(self.spider))
+        
+        self.pipeline.validation_manager.validate_scraping_result.assert_awaited_once()
+        kwargs = self.pipeline.validation_manager.validate_scraping_result.call_args.kwargs
+        self.assertEqual(kwargs['scraped_data'], [{'title': 'Product 1'}])
 
 
 class TestSQLitePipeline(unittest.TestCase):
@@ -299,6 +427,19 @@ class TestSQLitePipeline(unittest.TestCase):
         self.assertEqual(len(self.pipeline.items_collected), 1)
         self.assertEqual(self.pipeline.items_collected[0]['title'], 'Test Product')
     
+    def test_process_item_flushes_full_batch(self):
+        """Test that items are written once the batch size is reached."""
+        self.pipeline.database_available = True
+        self.pipeline.batch_size = 2
+        
+        self.pipeline.process_item(SuperScraperItem({'title': 'Product 1'}), self.spider)
+        self.mock_database.save_items.assert_not_called()
+        
+        self.pipeline.process_item(SuperScraperItem({'title': 'Product 2'}), self.spider)
+        self.mock_database.save_items.assert_called_once()
+        self.assertEqual(self.pipeline.items_collected, [])
+        self.assertEqual(self.pipeline.items_saved, 2)
+    
     def test_close_spider_saves_items(self):
         """Test that closing spider saves items to database."""
         self.pipeline.database_available = True
@@ -74,9 +74,10 @@ class TestPlaywrightScraper(unittest.TestCase):
             ("YES", True),
             ("Out of Stock", False),
             ("Sold Out", False),
-            ("unavailable", True),  # Contains "available"
+            ("unavailable", False),
             ("NO", False),
-            ("Unknown status", False),  # Implementation returns False for unknown
+            ("Unknown status", None),  # "no" only counts as a whole word
+            ("Only a few left - now shipping", None),
             ("", None),
             (None, None),
         ]
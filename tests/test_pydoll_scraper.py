@@ -78,9 +78,10 @@ class TestPydollScraper(unittest.TestCase):
             ("YES", True),
             ("Out of Stock", False),
             ("Sold Out", False),
-            ("unavailable", True),  # Contains "available"
+            ("unavailable", False),
             ("NO", False),
-            ("Unknown status", False),  # Implementation returns False for unknown
+            ("Unknown status", None),  # "no" only counts as a whole word
+            ("Only a few left - now shipping", None),
             ("", None),
             (None, None),
         ]
@@ -117,6 +118,32 @@ class TestPydollScraper(unittest.TestCase):
         self.assertTrue(result['stock_availability'])
         self.assertEqual(result['image_url'], '../media/cache/test.jpg')
     
+    def test_extract_item_from_soup_element_mixed_cards(self):
+        """Test that an unusual card doesn't change selector priority for later cards."""
+        html = '''
+        <div>
+            <article class="product_pod">
+                <h2><a href="/alt">Alt</a></h2>
+                <span class="price">$99.00</span>
+            </article>
+            <article class="product_pod">
+                <h2><a href="/alt">Alt</a></h2>
+                <span class="price">$99.00</span>
+                <h3><a href="/t3" title="T3">T3</a></h3>
+                <p class="price_color">$3.00</p>
+            </article>
+        </div>
+        '''
+        
+        soup = BeautifulSoup(html, 'html.parser')
+        unusual, normal = soup.find_all('article')
+        
+        first = self.scraper.extract_item_from_soup_element(unusual, "https://example.com")
+        second = self.scraper.extract_item_from_soup_element(normal, "https://example.com")
+        
+        self.assertEqual((first['title'], first['price']), ('Alt', 99.0))
+        self.assertEqual((second['title'], second['price']), ('T3', 3.0))
+    
     def test_extract_item_from_soup_element_no_title(self):
         """Test that element without title returns None."""
         html = '<div><p>No title here</p></div>'
@@ -8,7 +8,7 @@ without making actual HTTP requests.
 import unittest
 from unittest.mock import Mock, patch
 from scrapy.http import TextResponse, Request
-from super_scraper.spiders.universal import UniversalSpider
+from super_scraper.spiders.universal import UniversalSpider, _absolute_url
 from super_scraper.items import SuperScraperItem
 
 
@@ -82,9 +82,11 @@ class TestUniversalSpider(unittest.TestCase):
             ('Available', True),
             ('in-stock', True),
             ('Out of stock', False),
-            ('Unavailable', True),
+            ('Unavailable', False),
             ('Sold out', False),
-            ('Unknown status', False),
+            ('No', False),
+            ('Unknown status', None),
+            ('Only a few left - now shipping', None),
             ('', None),
         ]
         
@@ -135,6 +137,106 @@ class TestUniversalSpider(unittest.TestCase):
         pagination_follows = [f for f in follows if f['callback'] == 'parse']
         self.assertTrue(len(pagination_follows) > 0)
     
+    def test_parse_skips_duplicate_page_content(self):
+        """Test parse skips a page whose body was already parsed under another URL."""
+        html = b'''
+        <html>
+            <body>
+                <article class="product_pod">
+                    <h3><a title="Book 1">Book 1</a></h3>
+                    <p class="price_color">$10.00</p>
+                </article>
+            </body>
+        </html>
+        '''
+        
+        first = TextResponse(url='https://example.com/', body=html)
+        second = TextResponse(url='https://example.com/?page=1', body=html)
+        
+        self.assertEqual(len(list(self.spider.parse(first))), 1)
+        self.assertEqual(list(self.spider.parse(second)), [])
+    
+    def test_seen_pages_is_bounded(self):
+        """Test the duplicate-page digests are capped, evicting the least recently seen."""
+        self.spider.seen_pages_limit = 2
+        
+        for page in range(3):
+            html = f'<html><body><p>Page {page}</p></body></html>'.encode('utf-8')
+            list(self.spider.parse(TextResponse(url=f'https://example.com/{page}', body=html)))
+        
+        self.assertEqual(len(self.spider.seen_pages), 2)
+    
+    def test_parse_remembers_item_selector(self):
+        """Test parse tries the container selector that matched on the previous page first."""
+        html = b'''
+        <html>
+            <body>
+                <div class="item"><h3><a title="Widget">Widget</a></h3></div>
+            </body>
+        </html>
+        '''
+        
+        response = TextResponse(url='https://example.com/', body=html)
+        items = list(self.spider.parse(response))
+        
+        self.assertEqual(len(items), 1)
+        self.assertEqual(self.spider.item_selector, 'div.item')
+    
+    def test_follow_product_links_skips_seen_urls(self):
+        """Test product links already followed are not requested again from another page."""
+        html = b'''
+        <html>
+            <body>
+                <article class="product_pod">
+                    <h3><a href="book1.html" title="Book 1">Book 1</a></h3>
+                </article>
+            </body>
+        </html>
+        '''
+        
+        first = TextResponse(url='https://example.com/', body=html)
+        second = TextResponse(url='https://example.com/index.html', body=html)
+        
+        requests = list(self.spider.follow_product_links(first))
+        
+        self.assertEqual([r.url for r in requests], ['https://example.com/book1.html'])
+        self.assertEqual(list(self.spider.follow_product_links(second)), [])
+    
+    def test_follow_product_links_honors_base_href(self):
+        """Test product links are resolved against the page's <base href>."""
+        html = b'''
+        <html>
+            <head><base href="https://example.com/catalogue/"></head>
+            <body>
+                <article class="product_pod">
+                    <h3><a href="book1.html" title="Book 1">Book 1</a></h3>
+                </article>
+            </body>
+        </html>
+        '''
+        
+        response = TextResponse(url='https://example.com/index.html', body=html)
+        requests = list(self.spider.follow_product_links(response))
+        
+        self.assertEqual([r.url for r in requests], ['https://example.com/catalogue/book1.html'])
+    
+    def test_absolute_url(self):
+        """Test image URL resolution against a page with a nested path."""
+        base_url = 'https://example.com/catalogue/category/page-2.html'
+        origin = 'https://example.com'
+        test_cases = [
+            ('/p/1', 'https://example.com/p/1'),
+            ('../p/1', 'https://example.com/catalogue/p/1'),
+            ('p/1', 'https://example.com/catalogue/category/p/1'),
+            ('/a/../p/1', 'https://example.com/p/1'),
+            ('//cdn/x', 'https://cdn/x'),
+            ('https://cdn.example.net/x.jpg', 'https://cdn.example.net/x.jpg'),
+            ('http://example.org/x.jpg', 'http://example.org/x.jpg'),
+        ]
+        
+        for url, expected in test_cases:
+            self.assertEqual(_absolute_url(base_url, origin, url), expected, f"Failed for input: {url}")
+    
     def test_extract_single_item(self):
         """Test extraction from a single product page."""
         html = '''
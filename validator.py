@@ -8,6 +8,7 @@ Provides three core capabilities:
 """
 
 import re
+import sys
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
@@ -16,7 +17,19 @@ from bs4 import BeautifulSoup
 import pandas as pd
 from enum import Enum
 
-@dataclass
+# Fallback blocking patterns, matched case-insensitively so the page body is never lowercased
+_SIMPLE_BLOCKING_PATTERNS = [
+    (pattern, re.compile(re.escape(pattern), re.IGNORECASE))
+    for pattern in ['captcha', 'access denied', 'blocked', 'rate limit']
+]
+
+# Currency symbol and thousands separators stripped from unprocessed price strings
+_PRICE_NOISE_TRANS = str.maketrans('', '', '$,')
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Container for validation results with detailed analysis"""
     is_successful: bool
@@ -229,9 +242,8 @@ class ScrapingValidator:
             except Exception as e:
                 self.logger.warning(f"Error parsing HTML content for blocking detection: {str(e)}")
                 # Fallback to simple text search if BeautifulSoup fails
-                simple_patterns = ['captcha', 'access denied', 'blocked', 'rate limit']
-                for pattern in simple_patterns:
-                    if pattern in content.lower():
+                for pattern, pattern_re in _SIMPLE_BLOCKING_PATTERNS:
+                    if pattern_re.search(content):
                         analysis['is_blocked'] = True
                         analysis['issues'].append(f'Basic blocking pattern detected: {pattern}')
                         analysis['confidence'] = max(analysis['confidence'], 0.7)
@@ -257,8 +269,9 @@ class ScrapingValidator:
             'x-access-denied': ('Access denied header', 0.9)
         }
         
+        header_names = {k.lower() for k in headers}
         for header, (message, confidence) in suspicious_headers.items():
-            if header.lower() in [k.lower() for k in headers.keys()]:
+            if header in header_names:
                 analysis['issues'].append(message)
                 analysis['confidence'] = max(analysis['confidence'], confidence)
         
@@ -477,7 +490,7 @@ class ScrapingValidator:
             elif isinstance(price, str):
                 # Handle case where pipeline didn't process the price
                 try:
-                    price_val = float(price.replace('$', '').replace(',', '').strip())
+                    price_val = float(price.translate(_PRICE_NOISE_TRANS))
                     if price_val >= 0:
                         valid_price_count += 1
                 except (ValueError, AttributeError):